@@ -0,0 +1,105 @@
+import pandas as pd
+import numpy as np
+from typing import Dict, Any, List
+from utils.logger import setup_logger
+from utils.records import Alerts, ALERT_TYPES, RISK_LEVELS
+
+logger = setup_logger(__name__)
+
+
+class AlertSystem:
+    """Generate early warning alerts"""
+
+    def __init__(self, config: Dict[str, Any] = None):
+        """Initialize alert system"""
+        self.config = config or {}
+        self.alerts = Alerts()
+        logger.info("AlertSystem initialized")
+
+    def build_alerts(self, forecast_df: pd.DataFrame,
+                     risk_df: pd.DataFrame = None,
+                     station_id: int = 0) -> Alerts:
+        """Build compact alert records from a merged temperature/rainfall forecast"""
+        thresholds = self.config.get('alert_thresholds', {})
+
+        batches = [
+            self._threshold_alerts(forecast_df, 'yhat_temp', 'extreme_heat',
+                                   thresholds.get('extreme_heat', 35), station_id),
+            self._threshold_alerts(forecast_df, 'yhat_rain', 'heavy_rainfall',
+                                   thresholds.get('heavy_rainfall', 50), station_id)
+        ]
+
+        # Drought alerts for every forecast day assessed at high risk
+        if risk_df is not None and 'drought_risk' in risk_df.columns:
+            high = (risk_df['drought_risk'] == 'High').to_numpy()
+            batches.append(self._make_alerts(
+                risk_df['ds'].to_numpy()[high],
+                risk_df['rainfall_21d'].to_numpy()[high],
+                'drought', np.nan, station_id
+            ))
+
+        return Alerts.concat(batches)
+
+    def check_thresholds(self, forecast_df: pd.DataFrame,
+                         risk_df: pd.DataFrame = None) -> List[Dict[str, Any]]:
+        """Check forecast against alert thresholds"""
+        logger.info("Checking alert thresholds")
+
+        self.alerts = self.build_alerts(forecast_df, risk_df)
+        logger.info(f"Generated {len(self.alerts)} alerts")
+        return self.alerts.to_dicts()
+
+    def load_alerts(self, alerts: Alerts):
+        """Add alert records produced elsewhere, e.g. by other stations"""
+        self.alerts = Alerts.concat([self.alerts, alerts])
+
+    def generate_alert_report(self, alerts: Alerts = None) -> str:
+        """Generate a text summary of alerts"""
+        alerts = self.alerts if alerts is None else alerts
+        records = alerts.records
+
+        if len(records) == 0:
+            return "No alerts generated - conditions within normal ranges"
+
+        lines = ["EARLY WARNING ALERTS", "-" * 40]
+        for code, alert_type in enumerate(ALERT_TYPES):
+            selected = records[records['alert_type'] == code]
+            if len(selected) == 0:
+                continue
+
+            stations = len(np.unique(selected['station_id']))
+            severity = RISK_LEVELS[selected['severity'].max()]
+            lines.append(
+                f"  {alert_type.replace('_', ' ').title()}: {len(selected)} alert(s) "
+                f"at {stations} station(s), {selected['date'].min()} to {selected['date'].max()}, "
+                f"peak {np.nanmax(selected['value']):.1f} [{severity}]"
+            )
+
+        return "\n".join(lines)
+
+    def _threshold_alerts(self, forecast_df: pd.DataFrame, value_col: str,
+                          alert_type: str, threshold: float,
+                          station_id: int) -> Alerts:
+        """Alert on every forecast day above a threshold"""
+        if value_col not in forecast_df.columns:
+            return Alerts()
+
+        values = forecast_df[value_col].to_numpy()
+        exceeded = values > threshold
+        return self._make_alerts(
+            forecast_df['ds'].to_numpy()[exceeded], values[exceeded],
+            alert_type, threshold, station_id
+        )
+
+    def _make_alerts(self, dates: np.ndarray, values: np.ndarray,
+                     alert_type: str, threshold: float,
+                     station_id: int) -> Alerts:
+        """Pack alert fields into a record array"""
+        records = np.empty(len(dates), dtype=Alerts.dtype)
+        records['station_id'] = station_id
+        records['alert_type'] = ALERT_TYPES.index(alert_type)
+        records['severity'] = RISK_LEVELS.index('High')
+        records['date'] = dates.astype('datetime64[D]')
+        records['value'] = values
+        records['threshold'] = threshold
+        return Alerts(records)
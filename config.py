@@ -87,4 +87,32 @@ ALERT_THRESHOLDS = {
 
 # Forecast settings
 FORECAST_DAYS = 30
-TRAIN_TEST_SPLIT = 0.9
\ No newline at end of file
+TRAIN_TEST_SPLIT = 0.9
+
+# Station metadata
+STATIONS = [
+    {'station_id': 'nairobi', 'lat': -1.2921, 'lon': 36.8219, 'region': 'Nairobi'},
+    {'station_id': 'mombasa', 'lat': -4.0435, 'lon': 39.6682, 'region': 'Coast'},
+    {'station_id': 'kisumu', 'lat': -0.0917, 'lon': 34.7680, 'region': 'Nyanza'},
+    {'station_id': 'nakuru', 'lat': -0.3031, 'lon': 36.0800, 'region': 'Rift Valley'},
+    {'station_id': 'garissa', 'lat': -0.4532, 'lon': 39.6461, 'region': 'North Eastern'}
+]
+
+# Scheduler settings
+SCHEDULER_SETTINGS = {
+    'stations': [station['station_id'] for station in STATIONS],
+    'state_file': 'scheduler_state.json',
+    'max_workers': 4,
+    'poll_interval': 5,            # seconds between queue checks
+    'max_model_age_hours': 24,     # refresh even without new data
+    'arrival_delay_minutes': 15,   # wait for late observations after new data
+    'retry_delay_minutes': 5       # first retry after a failed run
+}
+
+# Forecast monitoring settings
+MONITORING_SETTINGS = {
+    'ewm_alpha': 0.1,          # weight of the newest error in the recent MAE
+    'drift_ratio': 1.5,        # current model's recent MAE / long-run MAE that flags drift
+    'min_observations': 30,    # observations per horizon before its errors count towards drift
+    'max_horizon_days': FORECAST_DAYS  # unobserved forecasts older than this are dropped
+}
\ No newline at end of file
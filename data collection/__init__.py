@@ -2,10 +2,12 @@
 Data Collection module for the Climate Forecasting System.
 
 This module contains the WeatherDataCollector class for
-generating and processing weather data.
+generating and processing weather data, and the ChunkedDataCleaner
+for cleaning data sets that do not fit in memory.
 """
 
 from .weather_collector import WeatherDataCollector
+from .chunked_cleaner import ChunkedDataCleaner, TDigest, csv_chunk_source
 
-__all__ = ['WeatherDataCollector']
+__all__ = ['WeatherDataCollector', 'ChunkedDataCleaner', 'TDigest', 'csv_chunk_source']
 __version__ = '1.0.0'
\ No newline at end of file
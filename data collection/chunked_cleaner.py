@@ -0,0 +1,208 @@
+import pandas as pd
+import numpy as np
+from typing import Callable, Dict, Any, Iterable, Iterator, List, Tuple
+from utils.logger import setup_logger
+from .weather_collector import (
+    FILL_COLUMNS, FILL_WINDOW, OUTLIER_COLUMNS, OUTLIER_QUANTILES, CLIP_BOUNDS
+)
+
+logger = setup_logger(__name__)
+
+ChunkSource = Callable[[], Iterable[pd.DataFrame]]
+
+
+class TDigest:
+    """Mergeable quantile sketch with bounded memory (merging t-digest)"""
+
+    def __init__(self, compression: int = 200):
+        """Initialize an empty sketch"""
+        self.compression = compression
+        self.count = 0
+        self.min = np.inf
+        self.max = -np.inf
+        self._means = np.empty(0)
+        self._weights = np.empty(0)
+        self._buffer: List[Tuple[np.ndarray, np.ndarray]] = []
+        self._buffered = 0
+        self._buffer_limit = 20 * compression
+
+    def update(self, values) -> None:
+        """Add raw observations to the sketch, ignoring NaNs"""
+        values = np.asarray(values, dtype=float).ravel()
+        values = values[~np.isnan(values)]
+        if len(values) == 0:
+            return
+
+        self._add(values, np.ones(len(values)))
+        self.min = min(self.min, values.min())
+        self.max = max(self.max, values.max())
+
+    def merge(self, other: 'TDigest') -> 'TDigest':
+        """Fold another sketch into this one"""
+        other._compress()
+        if other.count:
+            self._add(other._means, other._weights)
+            self.min = min(self.min, other.min)
+            self.max = max(self.max, other.max)
+        return self
+
+    def quantile(self, q: float) -> float:
+        """Estimate the q-th quantile (0 <= q <= 1)"""
+        self._compress()
+        if self.count == 0:
+            return np.nan
+        if q <= 0:
+            return float(self.min)
+        if q >= 1:
+            return float(self.max)
+
+        # Centroid centres in rank space, anchored at the observed extremes;
+        # with singleton centroids this reproduces linear-interpolated quantiles
+        centres = np.cumsum(self._weights) - self._weights / 2
+        ranks = np.concatenate([[0.0], centres, [self.count]])
+        values = np.concatenate([[self.min], self._means, [self.max]])
+        return float(np.interp(q * (self.count - 1) + 0.5, ranks, values))
+
+    def _add(self, means: np.ndarray, weights: np.ndarray) -> None:
+        """Buffer centroids and compress once the buffer is full"""
+        self._buffer.append((means, weights))
+        self._buffered += len(means)
+        self.count += int(weights.sum())
+        if self._buffered >= self._buffer_limit:
+            self._compress()
+
+    def _compress(self) -> None:
+        """Merge buffered points into centroids sized by the k1 scale function"""
+        if not self._buffer:
+            return
+
+        means = np.concatenate([self._means] + [m for m, _ in self._buffer])
+        weights = np.concatenate([self._weights] + [w for _, w in self._buffer])
+        self._buffer = []
+        self._buffered = 0
+
+        order = np.argsort(means, kind='mergesort')
+        means, weights = means[order], weights[order]
+
+        # Bucket each point by the scale value at its left rank edge so that
+        # centroids stay small in the tails and large around the median
+        total = weights.sum()
+        left_q = (np.cumsum(weights) - weights) / total
+        k = self.compression / (2 * np.pi) * np.arcsin(2 * left_q - 1)
+        bucket = np.floor(k - k[0]).astype(np.int64)
+        starts = np.flatnonzero(np.diff(bucket, prepend=-1))
+
+        self._weights = np.add.reduceat(weights, starts)
+        self._means = np.add.reduceat(means * weights, starts) / self._weights
+
+
+class ChunkedDataCleaner:
+    """Clean weather data chunk by chunk in fixed memory"""
+
+    def __init__(self, config: Dict[str, Any] = None):
+        """Initialize chunked cleaner"""
+        self.config = config or {}
+        self.compression = self.config.get('sketch_compression', 200)
+        self.bounds: Dict[str, Tuple[float, float]] = {}
+        logger.info("ChunkedDataCleaner initialized")
+
+    def fit(self, chunk_source: ChunkSource) -> Dict[str, Tuple[float, float]]:
+        """
+        Estimate outlier bounds with one streaming pass per outlier column
+
+        Args:
+            chunk_source: Callable returning a fresh iterable of date-sorted chunks
+
+        Returns:
+            Lower and upper bound per outlier column
+        """
+        lower_q, upper_q = OUTLIER_QUANTILES
+        self.bounds = {}
+
+        # Each column's quantiles are taken after the previous columns have
+        # been filtered, matching the sequential in-memory cleaning
+        for col in OUTLIER_COLUMNS:
+            digest = TDigest(self.compression)
+            for _, chunk in self._prepared_chunks(chunk_source):
+                digest.update(chunk[col].to_numpy())
+
+            self.bounds[col] = (digest.quantile(lower_q), digest.quantile(upper_q))
+            logger.info(f"Estimated {col} bounds from {digest.count} records: "
+                        f"{self.bounds[col][0]:.2f} - {self.bounds[col][1]:.2f}")
+
+        return self.bounds
+
+    def transform(self, chunk_source: ChunkSource) -> Iterator[pd.DataFrame]:
+        """Yield cleaned chunks using previously fitted bounds"""
+        if set(self.bounds) != set(OUTLIER_COLUMNS):
+            raise ValueError("Outlier bounds not fitted. Call fit first.")
+
+        initial_count = 0
+        cleaned_count = 0
+        for input_rows, chunk in self._prepared_chunks(chunk_source):
+            initial_count += input_rows
+            chunk = chunk.assign(**{
+                col: chunk[col].clip(lower, upper)
+                for col, (lower, upper) in CLIP_BOUNDS.items()
+            })
+            cleaned_count += len(chunk)
+            yield chunk
+
+        logger.info(f"Cleaned data: {cleaned_count} records "
+                    f"(removed {initial_count - cleaned_count})")
+
+    def clean(self, chunk_source: ChunkSource) -> Iterator[pd.DataFrame]:
+        """Fit outlier bounds and yield cleaned chunks"""
+        logger.info("Cleaning weather data in chunks")
+        self.fit(chunk_source)
+        return self.transform(chunk_source)
+
+    def _prepared_chunks(self, chunk_source: ChunkSource) -> Iterator[Tuple[int, pd.DataFrame]]:
+        """Deduplicate, gap-fill and apply the fitted bounds to each chunk"""
+        last_date = None
+        history = None
+        look_back = FILL_WINDOW - 1
+
+        for chunk in chunk_source():
+            input_rows = len(chunk)
+            if chunk.empty:
+                yield input_rows, chunk
+                continue
+
+            # Deduplication and the rolling fill need date-sorted input; unsorted
+            # partitions would otherwise silently lose rows
+            if not chunk['date'].is_monotonic_increasing or (
+                    last_date is not None and chunk['date'].iloc[0] < last_date):
+                raise ValueError("Chunks must be sorted by date within and across chunks")
+
+            # Sorted input means duplicates can only repeat the latest date
+            chunk = chunk.drop_duplicates(subset=['date'])
+            if last_date is not None:
+                chunk = chunk[chunk['date'] > last_date]
+            if chunk.empty:
+                yield input_rows, chunk
+                continue
+            last_date = chunk['date'].iloc[-1]
+
+            # Rolling fill with the previous chunk's tail as bounded look-back
+            raw = chunk[FILL_COLUMNS]
+            window = raw if history is None else pd.concat([history, raw])
+            means = window.rolling(FILL_WINDOW, min_periods=1).mean().iloc[-len(raw):]
+            means.index = raw.index
+            history = window.iloc[-look_back:]
+            chunk = chunk.assign(**{
+                col: raw[col].fillna(means[col]) for col in FILL_COLUMNS
+            })
+
+            for col, (lower, upper) in self.bounds.items():
+                chunk = chunk[(chunk[col] >= lower) & (chunk[col] <= upper)]
+
+            yield input_rows, chunk
+
+
+def csv_chunk_source(path: str, chunksize: int = 1_000_000) -> ChunkSource:
+    """Build a re-readable chunk source over a date-sorted CSV file"""
+    def read_chunks() -> Iterable[pd.DataFrame]:
+        return pd.read_csv(path, parse_dates=['date'], chunksize=chunksize)
+
+    return read_chunks
@@ -6,6 +6,18 @@ from utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+# Cleaning rules shared by the in-memory and chunked cleaning paths
+FILL_COLUMNS = ['temperature', 'rainfall', 'humidity', 'wind_speed']
+FILL_WINDOW = 7
+OUTLIER_COLUMNS = ['temperature', 'humidity']
+OUTLIER_QUANTILES = (0.01, 0.99)
+CLIP_BOUNDS = {
+    'temperature': (-10, 50),
+    'humidity': (0, 100),
+    'rainfall': (0, 500),
+    'wind_speed': (0, 150)
+}
+
 
 class WeatherDataCollector:
     """Collect and process weather data"""
@@ -15,11 +27,12 @@ class WeatherDataCollector:
         self.config = config or {}
         logger.info("WeatherDataCollector initialized")
     
-    def generate_historical_data(self, years: int = 10) -> pd.DataFrame:
+    def generate_historical_data(self, years: int = 10, seed: int = 42) -> pd.DataFrame:
         """Generate historical weather data for demonstration"""
         logger.info(f"Generating {years} years of historical weather data")
         
-        np.random.seed(42)
+        # Private generator so concurrent callers do not share the global RNG
+        rng = np.random.RandomState(seed)
         
         # Date range
         end_date = datetime.now()
@@ -31,23 +44,23 @@ class WeatherDataCollector:
             # Temperature (Celsius) - with seasonal variation
             base_temp = self.config.get('temperature_base', 25)
             seasonal_temp = self.config.get('seasonal_variation', 5) * np.sin(2 * np.pi * date.dayofyear / 365)
-            daily_variation = np.random.normal(0, 2)
+            daily_variation = rng.normal(0, 2)
             temperature = base_temp + seasonal_temp + daily_variation
             
             # Rainfall (mm) - with rainy/dry seasons
             month = date.month
             if month in [3, 4, 5, 10, 11]:  # Rainy seasons
-                rainfall = max(0, np.random.exponential(15))
+                rainfall = max(0, rng.exponential(15))
             else:  # Dry seasons
-                rainfall = max(0, np.random.exponential(2))
+                rainfall = max(0, rng.exponential(2))
             
             # Humidity (%) - correlated with rainfall
             base_humidity = self.config.get('base_humidity', 60)
-            humidity = base_humidity + (rainfall / 5) + np.random.normal(0, 5)
+            humidity = base_humidity + (rainfall / 5) + rng.normal(0, 5)
             humidity = np.clip(humidity, 30, 95)
             
             # Wind speed (km/h)
-            wind_speed = max(0, np.random.gamma(2, 5))
+            wind_speed = max(0, rng.gamma(2, 5))
             
             data.append({
                 'date': date,
@@ -71,20 +84,23 @@ class WeatherDataCollector:
         df = df.drop_duplicates(subset=['date'])
         
         # Handle missing values
-        for col in ['temperature', 'rainfall', 'humidity', 'wind_speed']:
-            df[col].fillna(df[col].rolling(7, min_periods=1).mean(), inplace=True)
+        df = df.assign(**{
+            col: df[col].fillna(df[col].rolling(FILL_WINDOW, min_periods=1).mean())
+            for col in FILL_COLUMNS
+        })
         
         # Remove extreme outliers
-        for col in ['temperature', 'humidity']:
-            Q1 = df[col].quantile(0.01)
-            Q3 = df[col].quantile(0.99)
+        lower_q, upper_q = OUTLIER_QUANTILES
+        for col in OUTLIER_COLUMNS:
+            Q1 = df[col].quantile(lower_q)
+            Q3 = df[col].quantile(upper_q)
             df = df[(df[col] >= Q1) & (df[col] <= Q3)]
         
         # Ensure logical constraints
-        df['temperature'] = df['temperature'].clip(-10, 50)
-        df['humidity'] = df['humidity'].clip(0, 100)
-        df['rainfall'] = df['rainfall'].clip(0, 500)
-        df['wind_speed'] = df['wind_speed'].clip(0, 150)
+        df = df.assign(**{
+            col: df[col].clip(lower, upper)
+            for col, (lower, upper) in CLIP_BOUNDS.items()
+        })
         
         logger.info(f"Cleaned data: {len(df)} records (removed {initial_count - len(df)})")
         return df
@@ -2,10 +2,12 @@
 Forecasting module for the Climate Forecasting System.
 
 This module contains the ClimateForecaster class for
-training models and generating weather forecasts.
+training models and generating weather forecasts, and the
+ForecastMonitor for tracking accuracy and drift.
 """
 
 from .climate_forecaster import ClimateForecaster
+from .monitoring import ForecastMonitor, MetricAccumulator
 
-__all__ = ['ClimateForecaster']
+__all__ = ['ClimateForecaster', 'ForecastMonitor', 'MetricAccumulator']
 __version__ = '1.0.0'
\ No newline at end of file
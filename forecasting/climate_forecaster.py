@@ -1,12 +1,18 @@
 import pandas as pd
-import numpy as np
 from prophet import Prophet
-from sklearn.metrics import mean_absolute_error, mean_squared_error, mean_absolute_percentage_error
 from typing import Dict, Any
 from utils.logger import setup_logger
+from forecasting.monitoring import MetricAccumulator
 
 logger = setup_logger(__name__)
 
+# Error metric behind each target's accuracy: rainfall has dry days with zero
+# actuals, where MAPE is undefined, so it always uses sMAPE
+ACCURACY_METRICS = {
+    'temperature': 'mape',
+    'rainfall': 'smape'
+}
+
 
 class ClimateForecaster:
     """Advanced climate forecasting system"""
@@ -108,7 +114,14 @@ class ClimateForecaster:
     def evaluate_model(self, actual_df: pd.DataFrame, 
                       forecast_df: pd.DataFrame,
                       metric: str = 'temperature') -> Dict[str, float]:
-        """Evaluate forecast accuracy"""
+        """
+        Evaluate forecast accuracy
+        
+        Accuracy is 100 - MAPE (%) for temperature and 100 - sMAPE (%) for
+        rainfall, using the standard 0-200% sMAPE =
+        mean(2|forecast - actual| / (|actual| + |forecast|)). Both are also
+        reported under their own keys.
+        """
         logger.info(f"Evaluating {metric} forecast")
         
         # Merge actual and forecast
@@ -123,16 +136,20 @@ class ClimateForecaster:
         actual = merged['temperature'] if metric == 'temperature' else merged['rainfall']
         predicted = merged['yhat']
         
-        mae = mean_absolute_error(actual, predicted)
-        rmse = np.sqrt(mean_squared_error(actual, predicted))
-        mape = mean_absolute_percentage_error(actual, predicted)
+        accumulator = MetricAccumulator()
+        accumulator.update(actual.to_numpy(), predicted.to_numpy())
+        if accumulator.count == 0:
+            raise ValueError(f"No {metric} observations overlap the forecast dates")
         
-        accuracy = (1 - mape) * 100
+        scores = accumulator.metrics()
+        accuracy = 100 - scores[ACCURACY_METRICS[metric]]
         
         metrics = {
-            'mae': round(mae, 2),
-            'rmse': round(rmse, 2),
-            'mape': round(mape * 100, 2),
+            'mae': round(scores['mae'], 2),
+            'rmse': round(scores['rmse'], 2),
+            'mape': round(scores['mape'], 2),
+            'smape': round(scores['smape'], 2),
+            'mase': round(scores['mase'], 2),
             'accuracy': round(accuracy, 2)
         }
         
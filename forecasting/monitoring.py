@@ -0,0 +1,243 @@
+import heapq
+import pandas as pd
+import numpy as np
+from typing import Dict, Any, List, Tuple
+from utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+MonitorKey = Tuple[str, str, int]
+DriftKey = Tuple[str, str]
+
+
+class MetricAccumulator:
+    """Streaming, mergeable forecast error statistics"""
+
+    __slots__ = ('count', 'sum_error', 'sum_abs_error', 'sum_sq_error',
+                 'sum_ape', 'ape_count', 'sum_sape', 'sum_naive_error',
+                 'naive_count', 'first_actual', 'last_actual', 'ewm_abs_error', 'alpha')
+
+    def __init__(self, alpha: float = 0.1):
+        """Initialize empty accumulator"""
+        self.count = 0
+        self.sum_error = 0.0
+        self.sum_abs_error = 0.0
+        self.sum_sq_error = 0.0
+        self.sum_ape = 0.0
+        self.ape_count = 0
+        self.sum_sape = 0.0
+        self.sum_naive_error = 0.0
+        self.naive_count = 0
+        self.first_actual = np.nan
+        self.last_actual = np.nan
+        self.ewm_abs_error = np.nan
+        self.alpha = alpha
+
+    def update(self, actual, predicted):
+        """Add one or more date-ordered observations"""
+        actual = np.atleast_1d(np.asarray(actual, dtype=float))
+        predicted = np.atleast_1d(np.asarray(predicted, dtype=float))
+        valid = ~(np.isnan(actual) | np.isnan(predicted))
+        actual, predicted = actual[valid], predicted[valid]
+        if len(actual) == 0:
+            return
+
+        error = predicted - actual
+        abs_error = np.abs(error)
+        nonzero = actual != 0
+        denom = np.abs(actual) + np.abs(predicted)
+
+        self.count += len(actual)
+        self.sum_error += error.sum()
+        self.sum_abs_error += abs_error.sum()
+        self.sum_sq_error += (error ** 2).sum()
+
+        # MAPE is only defined on non-zero actuals; sMAPE is 0 when both are 0
+        self.sum_ape += (abs_error[nonzero] / np.abs(actual[nonzero])).sum()
+        self.ape_count += int(nonzero.sum())
+        self.sum_sape += np.divide(2 * abs_error, denom, out=np.zeros_like(denom), where=denom > 0).sum()
+
+        # One-step naive forecast errors give the MASE scale
+        series = np.concatenate([[self.last_actual], actual])
+        naive = np.abs(np.diff(series))
+        naive = naive[~np.isnan(naive)]
+        self.sum_naive_error += naive.sum()
+        self.naive_count += len(naive)
+        if np.isnan(self.first_actual):
+            self.first_actual = actual[0]
+        self.last_actual = actual[-1]
+
+        # Exponentially weighted recent error, applied to the batch in closed form
+        if np.isnan(self.ewm_abs_error):
+            self.ewm_abs_error, abs_error = abs_error[0], abs_error[1:]
+        decay = (1 - self.alpha) ** np.arange(len(abs_error) - 1, -1, -1)
+        self.ewm_abs_error = ((1 - self.alpha) ** len(abs_error) * self.ewm_abs_error
+                              + self.alpha * (decay * abs_error).sum())
+
+    def merge(self, other: 'MetricAccumulator') -> 'MetricAccumulator':
+        """Fold the accumulator of the following observations into this one"""
+        ewm = [(acc.ewm_abs_error, acc.count) for acc in (self, other)
+               if acc.count and not np.isnan(acc.ewm_abs_error)]
+
+        self.count += other.count
+        self.sum_error += other.sum_error
+        self.sum_abs_error += other.sum_abs_error
+        self.sum_sq_error += other.sum_sq_error
+        self.sum_ape += other.sum_ape
+        self.ape_count += other.ape_count
+        self.sum_sape += other.sum_sape
+        self.sum_naive_error += other.sum_naive_error
+        self.naive_count += other.naive_count
+
+        # The naive error spanning the two batches belongs to neither
+        if not (np.isnan(self.last_actual) or np.isnan(other.first_actual)):
+            self.sum_naive_error += abs(other.first_actual - self.last_actual)
+            self.naive_count += 1
+        if np.isnan(self.first_actual):
+            self.first_actual = other.first_actual
+        if not np.isnan(other.last_actual):
+            self.last_actual = other.last_actual
+        if ewm:
+            self.ewm_abs_error = sum(v * n for v, n in ewm) / sum(n for _, n in ewm)
+        return self
+
+    def metrics(self) -> Dict[str, float]:
+        """
+        Current metric values
+
+        MAPE (%) covers non-zero actuals only. sMAPE (%) is the standard
+        0-200% mean(2|e| / (|actual| + |forecast|)), taken as 0 when both are 0.
+        MASE scales MAE by the one-step naive forecast error.
+        """
+        if self.count == 0:
+            return {'count': 0}
+
+        mae = self.sum_abs_error / self.count
+        naive_mae = self.sum_naive_error / self.naive_count if self.naive_count else np.nan
+        return {
+            'count': self.count,
+            'bias': self.sum_error / self.count,
+            'mae': mae,
+            'rmse': np.sqrt(self.sum_sq_error / self.count),
+            'mape': self.sum_ape / self.ape_count * 100 if self.ape_count else np.nan,
+            'smape': self.sum_sape / self.count * 100,
+            'mase': mae / naive_mae if naive_mae else np.nan,
+            'recent_mae': self.ewm_abs_error
+        }
+
+
+class ForecastMonitor:
+    """Track forecast accuracy per station, target and horizon and flag drift"""
+
+    def __init__(self, config: Dict[str, Any] = None):
+        """Initialize forecast monitor"""
+        self.config = config or {}
+        self.alpha = self.config.get('ewm_alpha', 0.1)
+        self.drift_ratio = self.config.get('drift_ratio', 1.5)
+        self.min_observations = self.config.get('min_observations', 30)
+        self.max_horizon = pd.Timedelta(days=self.config.get('max_horizon_days', 30))
+        self.accumulators: Dict[MonitorKey, MetricAccumulator] = {}
+
+        # Forecasts waiting for their observation: (station, target, date) -> (issued, horizon, yhat),
+        # with a heap of pending dates so never-observed forecasts can be expired.
+        # Only the latest run per station and target is scored; entries from
+        # earlier runs are superseded and dropped when reached
+        self._pending: Dict[Tuple[str, str, pd.Timestamp], Tuple[pd.Timestamp, int, float]] = {}
+        self._expiry: List[Tuple[pd.Timestamp, str, str]] = []
+        self._issued: Dict[DriftKey, pd.Timestamp] = {}
+
+        # Recent error of the current model per station and target, as an EWM of
+        # each error over the long-run MAE at its horizon; 1.0 for a new model
+        self._recent_ratio: Dict[DriftKey, float] = {}
+        logger.info("ForecastMonitor initialized")
+
+    def record_forecast(self, station_id: str, target: str,
+                        forecast_df: pd.DataFrame, issued: pd.Timestamp):
+        """
+        Remember a forecast so later observations can be scored against it
+
+        A forecast issued after the previous one for the same station and target
+        comes from a new model: it supersedes the pending forecasts of the old
+        model and restarts the drift check for that station and target
+        """
+        issued = pd.Timestamp(issued)
+        latest = self._issued.get((station_id, target))
+        if latest is not None and issued < latest:
+            logger.warning(f"Ignoring {target} forecast for {station_id} issued "
+                           f"before the current one ({issued} < {latest})")
+            return
+        self._issued[(station_id, target)] = issued
+        self._recent_ratio.pop((station_id, target), None)
+
+        dates = pd.to_datetime(forecast_df['ds']).dt.normalize()
+        horizons = (dates - issued.normalize()).dt.days
+        for date, horizon, yhat in zip(dates, horizons, forecast_df['yhat']):
+            key = (station_id, target, date)
+            if key not in self._pending:
+                heapq.heappush(self._expiry, (date, station_id, target))
+            self._pending[key] = (issued, int(horizon), float(yhat))
+
+        self._expire(issued.normalize() - self.max_horizon)
+
+    def observe(self, station_id: str, target: str,
+                date: pd.Timestamp, actual: float) -> List[DriftKey]:
+        """
+        Score the current model's pending forecast for an observed value
+
+        Returns:
+            The station and target if its error has drifted enough to warrant retraining
+        """
+        date = pd.Timestamp(date).normalize()
+        forecast = self._pending.pop((station_id, target, date), None)
+        self._expire(date - self.max_horizon)
+        if forecast is None or forecast[0] != self._issued.get((station_id, target)):
+            return []
+
+        _, horizon, yhat = forecast
+        key = (station_id, target, horizon)
+        acc = self.accumulators.get(key)
+        if acc is not None and acc.count >= self.min_observations and acc.sum_abs_error > 0:
+            ratio = abs(yhat - actual) / (acc.sum_abs_error / acc.count)
+            if not np.isnan(ratio):
+                recent = self._recent_ratio.get((station_id, target), 1.0)
+                self._recent_ratio[(station_id, target)] = (1 - self.alpha) * recent + self.alpha * ratio
+
+        self.update(key, actual, yhat)
+        return [(station_id, target)] if self.is_drifting(station_id, target) else []
+
+    def _expire(self, before: pd.Timestamp):
+        """Drop pending forecasts for dates before the cutoff that were never observed"""
+        while self._expiry and self._expiry[0][0] < before:
+            date, station_id, target = heapq.heappop(self._expiry)
+            self._pending.pop((station_id, target, date), None)
+
+    def update(self, key: MonitorKey, actual, predicted):
+        """Add observations directly to one accumulator"""
+        if key not in self.accumulators:
+            self.accumulators[key] = MetricAccumulator(self.alpha)
+        self.accumulators[key].update(actual, predicted)
+
+    def is_drifting(self, station_id: str, target: str) -> bool:
+        """Current model's recent error well above the long-run error at the same horizons"""
+        return self._recent_ratio.get((station_id, target), 1.0) > self.drift_ratio
+
+    def drifted(self) -> List[DriftKey]:
+        """All stations and targets currently flagged for retraining"""
+        return [key for key in self._recent_ratio if self.is_drifting(*key)]
+
+    def merge(self, other: 'ForecastMonitor') -> 'ForecastMonitor':
+        """Fold accumulators from another monitor into this one"""
+        for key, acc in other.accumulators.items():
+            if key not in self.accumulators:
+                self.accumulators[key] = MetricAccumulator(self.alpha)
+            self.accumulators[key].merge(acc)
+        return self
+
+    def metrics(self) -> pd.DataFrame:
+        """Metrics for every station, target and horizon"""
+        rows = [
+            {'station_id': key[0], 'target': key[1], 'horizon': key[2],
+             **acc.metrics(), 'drift': self.is_drifting(key[0], key[1])}
+            for key, acc in self.accumulators.items()
+        ]
+        return pd.DataFrame(rows)
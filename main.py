@@ -1,14 +1,33 @@
 import sys
 import os
+import zlib
+import importlib.util
 
 # Add project root to Python path
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(PROJECT_ROOT)
 
-from pipeline.forecasting_pipeline import ClimateForecastingPipeline
 import config
 
+def register_data_collection():
+    """Expose the 'data collection' directory as the data_collection package"""
+    if 'data_collection' in sys.modules:
+        return
+    
+    package_dir = os.path.join(PROJECT_ROOT, 'data collection')
+    spec = importlib.util.spec_from_file_location(
+        'data_collection', os.path.join(package_dir, '__init__.py'),
+        submodule_search_locations=[package_dir]
+    )
+    module = importlib.util.module_from_spec(spec)
+    sys.modules['data_collection'] = module
+    spec.loader.exec_module(module)
+
+register_data_collection()
+
 def main():
     """Main entry point for the Climate Forecasting System"""
+    from pipeline.forecasting_pipeline import ClimateForecastingPipeline
     
     # Load configuration
     pipeline_config = {
@@ -52,29 +71,65 @@ def main():
         print(f"\nError running pipeline: {str(e)}")
         sys.exit(1)
 
-def save_results(results: dict):
+def save_results(results: dict, output_dir: str = 'results'):
     """Save forecast results to files"""
     import pandas as pd
     
     # Create results directory
-    os.makedirs('results', exist_ok=True)
+    os.makedirs(output_dir, exist_ok=True)
     
     # Save temperature forecast
     if 'temp_forecast' in results:
-        results['temp_forecast'].to_csv('results/temperature_forecast.csv', index=False)
+        results['temp_forecast'].to_csv(os.path.join(output_dir, 'temperature_forecast.csv'), index=False)
     
     # Save rainfall forecast
     if 'rain_forecast' in results:
-        results['rain_forecast'].to_csv('results/rainfall_forecast.csv', index=False)
+        results['rain_forecast'].to_csv(os.path.join(output_dir, 'rainfall_forecast.csv'), index=False)
     
     # Save metrics
     if 'temp_metrics' in results:
-        pd.DataFrame([results['temp_metrics']]).to_csv('results/temperature_metrics.csv', index=False)
+        pd.DataFrame([results['temp_metrics']]).to_csv(os.path.join(output_dir, 'temperature_metrics.csv'), index=False)
     
     if 'rain_metrics' in results:
-        pd.DataFrame([results['rain_metrics']]).to_csv('results/rainfall_metrics.csv', index=False)
+        pd.DataFrame([results['rain_metrics']]).to_csv(os.path.join(output_dir, 'rainfall_metrics.csv'), index=False)
+    
+    print(f"\nResults saved to '{output_dir}/' directory")
+
+def run_scheduler():
+    """Keep per-station forecasts fresh until interrupted"""
+    from data_collection.weather_collector import WeatherDataCollector
+    from forecasting.monitoring import ForecastMonitor
+    from scheduler.forecast_scheduler import ForecastScheduler, make_forecast_job
     
-    print("\nResults saved to 'results/' directory")
+    collector = WeatherDataCollector(config.DATA_SETTINGS)
+    
+    def load_station_data(station_id: str):
+        # Synthetic history until station feeds are connected, seeded per station
+        data = collector.generate_historical_data(
+            config.DATA_SETTINGS['historical_years'],
+            seed=zlib.crc32(station_id.encode())
+        )
+        return collector.clean_data(data)
+    
+    def save_station_results(station_id: str, results: dict):
+        save_results(results, os.path.join('results', station_id))
+    
+    # Station feeds report new observations through scheduler.notify_data(...,
+    # observations=df); the monitor scores them and requests retrains on drift
+    monitor = ForecastMonitor(config.MONITORING_SETTINGS)
+    job = make_forecast_job(load_station_data, config.MODEL_SETTINGS, config.FORECAST_DAYS)
+    scheduler = ForecastScheduler(job, config.SCHEDULER_SETTINGS,
+                                  on_result=save_station_results, monitor=monitor)
+    for station_id in config.SCHEDULER_SETTINGS['stations']:
+        scheduler.add_station(station_id)
+    
+    try:
+        scheduler.run_forever()
+    except KeyboardInterrupt:
+        print(f"\nScheduler metrics: {scheduler.metrics()}")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    if '--schedule' in sys.argv:
+        run_scheduler()
+    else:
+        main()
\ No newline at end of file
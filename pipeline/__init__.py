@@ -1,11 +1,11 @@
 """
-Risk Assessment module for the Climate Forecasting System.
+Pipeline module for the Climate Forecasting System.
 
-This module contains the RiskAssessor class for
-evaluating climate-related risks.
+This module contains the ClimateForecastingPipeline class
+that orchestrates the complete forecasting workflow.
 """
 
-from .risk_assessor import RiskAssessor
+from .forecasting_pipeline import ClimateForecastingPipeline
 
-__all__ = ['RiskAssessor']
+__all__ = ['ClimateForecastingPipeline']
 __version__ = '1.0.0'
\ No newline at end of file
@@ -1,11 +1,11 @@
 """
-Pipeline module for the Climate Forecasting System.
+Risk Assessment module for the Climate Forecasting System.
 
-This module contains the ClimateForecastingPipeline class
-that orchestrates the complete forecasting workflow.
+This module contains the RiskAssessor class for
+evaluating climate-related risks.
 """
 
-from .forecasting_pipeline import ClimateForecastingPipeline
+from .risk_assessor import RiskAssessor
 
-__all__ = ['ClimateForecastingPipeline']
+__all__ = ['RiskAssessor']
 __version__ = '1.0.0'
\ No newline at end of file
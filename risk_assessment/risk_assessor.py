@@ -1,10 +1,18 @@
 import pandas as pd
 import numpy as np
-from typing import Dict, Any
+from typing import Dict, Any, Union
 from utils.logger import setup_logger
+from utils.records import RiskEpisodes, RISK_LEVELS, RISK_TYPES
 
 logger = setup_logger(__name__)
 
+# Level column written by each assess_* method
+RISK_COLUMNS = {
+    'drought': 'drought_risk',
+    'flood': 'flood_risk',
+    'extreme_heat': 'heat_risk'
+}
+
 
 class RiskAssessor:
     """Assess climate-related risks"""
@@ -87,7 +95,46 @@ class RiskAssessor:
         
         return risk_df
     
-    def calculate_financial_impact(self, risk_df: pd.DataFrame, 
+    def extract_risk_episodes(self, risk_df: pd.DataFrame,
+                              risk_type: str = 'drought',
+                              station_id: int = 0) -> RiskEpisodes:
+        """Collapse a daily risk frame into compact risk episode records"""
+        logger.info(f"Extracting {risk_type} risk episodes")
+        
+        impact_values = self.config.get('financial_impact', {})
+        risk_col = RISK_COLUMNS[risk_type]
+        score_col = 'risk_score' if 'risk_score' in risk_df.columns else 'yhat'
+        
+        codes = pd.Categorical(risk_df[risk_col], categories=RISK_LEVELS).codes
+        scores = risk_df[score_col].to_numpy(dtype=float)
+        dates = risk_df['ds'].to_numpy().astype('datetime64[D]')
+        
+        if len(codes) == 0:
+            return RiskEpisodes()
+        
+        # Runs of consecutive days at the same level; unassessed days (NaN) are dropped
+        starts = np.flatnonzero(np.r_[True, codes[1:] != codes[:-1]])
+        ends = np.r_[starts[1:], len(codes)] - 1
+        peaks = np.fmax.reduceat(scores, starts)
+        keep = codes[starts] >= 0
+        starts, ends, peaks = starts[keep], ends[keep], peaks[keep]
+        
+        levels = codes[starts]
+        level_impact = np.array([impact_values.get(level, 0) for level in RISK_LEVELS], dtype=float)
+        
+        episodes = np.empty(len(starts), dtype=RiskEpisodes.dtype)
+        episodes['station_id'] = station_id
+        episodes['risk_type'] = RISK_TYPES.index(risk_type)
+        episodes['level'] = levels
+        episodes['days'] = ends - starts + 1
+        episodes['start'] = dates[starts]
+        episodes['end'] = dates[ends]
+        episodes['peak_score'] = peaks
+        episodes['impact'] = episodes['days'] * level_impact[levels]
+        
+        return RiskEpisodes(episodes)
+    
+    def calculate_financial_impact(self, risk_df: Union[pd.DataFrame, RiskEpisodes],
                                    risk_type: str = 'drought') -> Dict[str, Any]:
         """Calculate potential financial impact"""
         logger.info(f"Calculating financial impact of {risk_type}")
@@ -95,7 +142,16 @@ class RiskAssessor:
         # Get impact values from config
         impact_values = self.config.get('financial_impact', {})
         
-        risk_col = f'{risk_type}_risk'
+        if isinstance(risk_df, RiskEpisodes):
+            days = risk_df.select(risk_type=risk_type).days_by_level()
+            return {
+                'total_impact': sum(impact_values.get(level, 0) * days[level] for level in RISK_LEVELS),
+                'high_risk_days': days['High'],
+                'medium_risk_days': days['Medium'],
+                'low_risk_days': days['Low']
+            }
+        
+        risk_col = RISK_COLUMNS[risk_type]
         if risk_col not in risk_df.columns:
             return {'total_impact': 0, 'high_risk_days': 0}
         
@@ -113,4 +169,40 @@ class RiskAssessor:
             'high_risk_days': high_risk_days,
             'medium_risk_days': (risk_df[risk_col] == 'Medium').sum(),
             'low_risk_days': (risk_df[risk_col] == 'Low').sum()
-        }
\ No newline at end of file
+        }
+    
+    def aggregate_by_region(self, episodes: RiskEpisodes,
+                            station_regions: pd.Series) -> pd.DataFrame:
+        """
+        Roll risk days and financial impact up by region and risk type
+        
+        Args:
+            episodes: Risk episodes for any number of stations
+            station_regions: Region name indexed by station code
+            
+        Returns:
+            One row per region and risk type with days per level and total impact
+        """
+        logger.info("Aggregating risk by region")
+        
+        records = episodes.records
+        regions = station_regions.reindex(records['station_id']).to_numpy()
+        
+        df = pd.DataFrame({
+            'region': regions,
+            'station_id': records['station_id'],
+            'risk_type': pd.Categorical.from_codes(records['risk_type'], categories=list(RISK_TYPES)),
+            'level': pd.Categorical.from_codes(records['level'], categories=list(RISK_LEVELS)),
+            'days': records['days'].astype(np.int64),
+            'impact': records['impact']
+        }).dropna(subset=['region'])
+        
+        days = df.pivot_table(index=['region', 'risk_type'], columns='level', values='days',
+                              aggfunc='sum', fill_value=0, observed=True)
+        days = days.reindex(columns=list(RISK_LEVELS), fill_value=0)
+        days.columns = [f'{level.lower()}_risk_days' for level in days.columns]
+        
+        summary = days.join(df.groupby(['region', 'risk_type'], observed=True)['impact'].sum()
+                            .rename('total_impact'))
+        summary['stations'] = df.groupby(['region', 'risk_type'], observed=True)['station_id'].nunique()
+        return summary.reset_index()
\ No newline at end of file
@@ -0,0 +1,11 @@
+"""
+Scheduler module for the Climate Forecasting System.
+
+This module contains the ForecastScheduler class that keeps
+per-station forecasts fresh as new data arrives.
+"""
+
+from .forecast_scheduler import ForecastScheduler, make_forecast_job
+
+__all__ = ['ForecastScheduler', 'make_forecast_job']
+__version__ = '1.0.0'
\ No newline at end of file
@@ -0,0 +1,334 @@
+import heapq
+import json
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, Future
+from typing import Callable, Dict, Any, List
+import pandas as pd
+from forecasting.climate_forecaster import ClimateForecaster
+from forecasting.monitoring import ForecastMonitor
+from utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# Observation column -> job result key holding that target's forecast
+FORECAST_TARGETS = {
+    'temperature': 'temp_forecast',
+    'rainfall': 'rain_forecast'
+}
+
+
+def make_forecast_job(data_loader: Callable[[str], pd.DataFrame],
+                      model_settings: Dict[str, Any] = None,
+                      forecast_days: int = 30) -> Callable[[str], Dict[str, Any]]:
+    """
+    Build a scheduler job that retrains and forecasts one station
+
+    Args:
+        data_loader: Returns the cleaned weather history for a station
+        model_settings: ClimateForecaster configuration
+        forecast_days: Forecast horizon in days
+
+    Returns:
+        Callable taking a station id and returning its forecasts
+    """
+    def run(station_id: str) -> Dict[str, Any]:
+        data = data_loader(station_id)
+        forecaster = ClimateForecaster(model_settings)
+        forecaster.train_temperature_model(data)
+        forecaster.train_rainfall_model(data)
+        return {
+            'temp_forecast': forecaster.predict_temperature(forecast_days),
+            'rain_forecast': forecaster.predict_rainfall(forecast_days)
+        }
+
+    return run
+
+
+class ForecastScheduler:
+    """Keep per-station forecasts fresh with a priority queue and a worker pool"""
+
+    def __init__(self, job: Callable[[str], Any], config: Dict[str, Any] = None,
+                 on_result: Callable[[str, Any], None] = None,
+                 monitor: ForecastMonitor = None,
+                 clock: Callable[[], float] = time.time):
+        """
+        Initialize forecast scheduler
+
+        Args:
+            job: Runs one station's forecast and returns its results
+            config: Scheduler settings
+            on_result: Receives (station_id, result) for every successful run;
+                a run only counts as completed once this has returned
+            monitor: Scores each run's forecasts against observations passed
+                to notify_data and requests a retrain when they drift
+            clock: Time source in epoch seconds
+        """
+        self.config = config or {}
+        self.job = job
+        self.on_result = on_result
+        self.monitor = monitor
+        self.clock = clock
+        self.max_workers = self.config.get('max_workers', 4)
+        self.max_model_age = self.config.get('max_model_age_hours', 24) * 3600
+        self.arrival_delay = self.config.get('arrival_delay_minutes', 15) * 60
+        self.retry_delay = self.config.get('retry_delay_minutes', 5) * 60
+        self.state_file = self.config.get('state_file')
+
+        # Heap entries are (due, station_id); entries whose due time no longer
+        # matches the station state are stale and skipped when popped
+        self._queue: List[tuple] = []
+        self._stations: Dict[str, Dict[str, Any]] = {}
+        self._in_flight: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self._monitor_lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers,
+                                            thread_name_prefix='forecast')
+
+        self._completed = deque(maxlen=1000)
+        self._lags = deque(maxlen=1000)
+        self._durations = deque(maxlen=1000)
+        self._counts = {'completed': 0, 'failed': 0}
+        self._dirty = False
+
+        if self.state_file and os.path.exists(self.state_file):
+            self.load_state()
+        logger.info("ForecastScheduler initialized")
+
+    def add_station(self, station_id: str, last_data: float = None):
+        """Register a station; new stations are due immediately"""
+        with self._lock:
+            if station_id in self._stations:
+                return
+            self._stations[station_id] = {
+                'last_data': last_data or self.clock(),
+                'last_run': None,
+                'last_attempt': None,
+                'failures': 0,
+                'retrain': False,
+                'due': None
+            }
+            self._reschedule(station_id)
+
+    def notify_data(self, station_id: str, arrival_time: float = None,
+                    observations: pd.DataFrame = None):
+        """
+        Record new observations for a station, pulling its refresh forward
+
+        Args:
+            station_id: Station the observations belong to
+            arrival_time: When the data arrived, defaults to now
+            observations: Optional rows with date and target columns, scored
+                against earlier forecasts when a monitor is configured
+        """
+        with self._lock:
+            state = self._stations.get(station_id)
+            if state is None:
+                raise KeyError(f"Unknown station: {station_id}")
+            state['last_data'] = max(state['last_data'], arrival_time or self.clock())
+            self._dirty = True
+            self._reschedule(station_id)
+
+        if observations is not None and self.monitor is not None:
+            drifted = self._score_observations(station_id, observations)
+            if drifted:
+                logger.warning(f"Forecast drift for {station_id}: {drifted}")
+                self.request_retrain(station_id)
+
+    def request_retrain(self, station_id: str):
+        """Make a station due now, e.g. when its forecasts have drifted"""
+        with self._lock:
+            state = self._stations.get(station_id)
+            if state is None:
+                raise KeyError(f"Unknown station: {station_id}")
+            state['retrain'] = True
+            self._dirty = True
+            self._reschedule(station_id)
+
+    def run_pending(self) -> int:
+        """Dispatch due stations up to the concurrency limit"""
+        dispatched = []
+        with self._lock:
+            now = self.clock()
+            while self._queue and len(self._in_flight) < self.max_workers:
+                due, station_id = self._queue[0]
+                if due > now:
+                    break
+                heapq.heappop(self._queue)
+
+                state = self._stations.get(station_id)
+                if state is None or state['due'] != due or station_id in self._in_flight:
+                    continue
+
+                state['due'] = None
+                self._lags.append(now - due)
+                future = self._executor.submit(self.job, station_id)
+                self._in_flight[station_id] = future
+                dispatched.append((station_id, now, future))
+
+        # Callbacks run inline for already finished futures, so they are
+        # attached only once the lock has been released
+        for station_id, started, future in dispatched:
+            future.add_done_callback(
+                lambda f, sid=station_id, started=started: self._on_complete(sid, started, f)
+            )
+        return len(dispatched)
+
+    def run_forever(self, stop_event: threading.Event = None):
+        """Dispatch due work until stopped"""
+        stop_event = stop_event or threading.Event()
+        poll_interval = self.config.get('poll_interval', 5)
+        logger.info(f"Scheduler running with {self.max_workers} workers")
+
+        try:
+            while not stop_event.is_set():
+                self.run_pending()
+                if self._dirty:
+                    self.save_state()
+                stop_event.wait(poll_interval)
+        finally:
+            self.shutdown()
+
+    def shutdown(self, wait: bool = True):
+        """Stop the worker pool and persist the queue"""
+        self._executor.shutdown(wait=wait)
+        self.save_state()
+        logger.info("Scheduler stopped")
+
+    def metrics(self, window: float = 300) -> Dict[str, Any]:
+        """Queue depth, scheduling lag and throughput for capacity planning"""
+        with self._lock:
+            now = self.clock()
+            due_now = sum(
+                1 for state in self._stations.values()
+                if state['due'] is not None and state['due'] <= now
+            )
+            recent = sum(1 for finished in self._completed if finished >= now - window)
+            lags = list(self._lags)
+            durations = list(self._durations)
+
+            return {
+                'stations': len(self._stations),
+                'queue_depth': due_now,
+                'in_flight': len(self._in_flight),
+                'oldest_due_lag_seconds': max(
+                    [now - state['due'] for state in self._stations.values()
+                     if state['due'] is not None and state['due'] <= now],
+                    default=0.0
+                ),
+                'avg_dispatch_lag_seconds': sum(lags) / len(lags) if lags else 0.0,
+                'avg_run_seconds': sum(durations) / len(durations) if durations else 0.0,
+                'throughput_per_minute': recent * 60 / window,
+                'completed': self._counts['completed'],
+                'failed': self._counts['failed']
+            }
+
+    def save_state(self):
+        """Write station state to the local state file"""
+        if not self.state_file:
+            return
+
+        with self._lock:
+            stations = {sid: dict(state) for sid, state in self._stations.items()}
+            self._dirty = False
+
+        # Due times are recomputed on load, so runs interrupted by a restart
+        # are picked up again from their last data and run timestamps
+        tmp_file = f"{self.state_file}.tmp"
+        with open(tmp_file, 'w') as f:
+            json.dump({'stations': stations}, f)
+        os.replace(tmp_file, self.state_file)
+
+    def load_state(self):
+        """Restore station state and rebuild the queue from the state file"""
+        with open(self.state_file) as f:
+            stations = json.load(f)['stations']
+
+        with self._lock:
+            self._stations = stations
+            self._queue = []
+            for station_id in self._stations:
+                self._reschedule(station_id)
+        logger.info(f"Restored {len(stations)} stations from {self.state_file}")
+
+    def _next_due(self, state: Dict[str, Any]) -> float:
+        """Due time from data arrival and model staleness"""
+        if state['failures']:
+            backoff = self.retry_delay * 2 ** min(state['failures'] - 1, 6)
+            return state['last_attempt'] + min(backoff, self.max_model_age)
+        if state.get('retrain'):
+            return self.clock()
+        if state['last_run'] is None:
+            return state['last_data']
+
+        due = state['last_run'] + self.max_model_age
+        if state['last_data'] > state['last_run']:
+            due = min(due, state['last_data'] + self.arrival_delay)
+        return due
+
+    def _reschedule(self, station_id: str):
+        """Recompute a station's due time and queue it; caller holds the lock"""
+        if station_id in self._in_flight:
+            return
+
+        state = self._stations[station_id]
+        state['due'] = self._next_due(state)
+        heapq.heappush(self._queue, (state['due'], station_id))
+        self._dirty = True
+
+    def _on_complete(self, station_id: str, started: float, future: Future):
+        """Hand results to the sink, then schedule the station's next refresh"""
+        error = future.exception()
+        if error is None:
+            # The sink runs outside the lock so it may call back into the scheduler
+            try:
+                if self.on_result is not None:
+                    self.on_result(station_id, future.result())
+                if self.monitor is not None:
+                    self._record_forecasts(station_id, started, future.result())
+            except Exception as e:
+                error = e
+
+        finished = self.clock()
+        with self._lock:
+            self._in_flight.pop(station_id, None)
+            state = self._stations.get(station_id)
+            if state is None:
+                return
+
+            state['last_attempt'] = started
+            if error is None:
+                state['last_run'] = started
+                state['failures'] = 0
+                state['retrain'] = False
+                self._counts['completed'] += 1
+                self._completed.append(finished)
+                self._durations.append(finished - started)
+            else:
+                state['failures'] += 1
+                self._counts['failed'] += 1
+                logger.error(f"Forecast for {station_id} failed: {error}")
+
+            self._reschedule(station_id)
+
+    def _record_forecasts(self, station_id: str, started: float, result: Dict[str, Any]):
+        """Hand a run's forecasts to the monitor"""
+        issued = pd.Timestamp(started, unit='s')
+        with self._monitor_lock:
+            for target, result_key in FORECAST_TARGETS.items():
+                if result_key in result:
+                    self.monitor.record_forecast(station_id, target, result[result_key], issued)
+
+    def _score_observations(self, station_id: str, observations: pd.DataFrame) -> List[tuple]:
+        """Score observations against pending forecasts; returns drifted (station, target) keys"""
+        drifted = []
+        observations = observations.sort_values('date')
+        with self._monitor_lock:
+            for target in FORECAST_TARGETS:
+                if target not in observations.columns:
+                    continue
+                for date, actual in zip(observations['date'], observations[target]):
+                    drifted.extend(self.monitor.observe(station_id, target, date, actual))
+        return sorted(set(drifted))
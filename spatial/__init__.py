@@ -0,0 +1,11 @@
+"""
+Spatial module for the Climate Forecasting System.
+
+This module contains the StationIndex class for nearest-station
+lookups, forecast interpolation and region assignment.
+"""
+
+from .station_index import StationIndex
+
+__all__ = ['StationIndex']
+__version__ = '1.0.0'
\ No newline at end of file
@@ -0,0 +1,150 @@
+import pandas as pd
+import numpy as np
+from scipy.spatial import cKDTree
+from typing import Dict, Any, List, Tuple
+from utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+EARTH_RADIUS_KM = 6371.0
+
+
+def _to_unit_vectors(lat, lon) -> np.ndarray:
+    """Convert latitude/longitude in degrees to 3D unit vectors"""
+    lat = np.radians(np.asarray(lat, dtype=float))
+    lon = np.radians(np.asarray(lon, dtype=float))
+    return np.column_stack([
+        np.cos(lat) * np.cos(lon),
+        np.cos(lat) * np.sin(lon),
+        np.sin(lat)
+    ])
+
+
+def _chord_to_km(chord: np.ndarray) -> np.ndarray:
+    """Convert unit-sphere chord length to great-circle distance"""
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.clip(chord / 2, 0, 1))
+
+
+def _km_to_chord(distance_km: float) -> float:
+    """Convert great-circle distance to unit-sphere chord length"""
+    return 2 * np.sin(min(distance_km / (2 * EARTH_RADIUS_KM), np.pi / 2))
+
+
+class StationIndex:
+    """Spatial index over weather stations for nearest-station lookups"""
+
+    def __init__(self, stations: List[Dict[str, Any]]):
+        """
+        Build the index from station metadata
+
+        Args:
+            stations: Records with station_id, lat, lon and optionally region;
+                a station's position in this list is the integer station code
+                used in RiskEpisodes and Alerts records
+        """
+        self.stations = pd.DataFrame(stations)
+        if self.stations['station_id'].duplicated().any():
+            raise ValueError("Station ids must be unique")
+
+        self._codes = pd.Series(self.stations.index, index=self.stations['station_id'])
+        self._tree = cKDTree(_to_unit_vectors(self.stations['lat'], self.stations['lon']))
+        logger.info(f"StationIndex built for {len(self.stations)} stations")
+
+    def __len__(self) -> int:
+        return len(self.stations)
+
+    def codes(self, station_ids) -> np.ndarray:
+        """Integer station codes for the given station ids"""
+        return self._codes.loc[list(station_ids)].to_numpy()
+
+    def nearest(self, lat, lon, k: int = 1) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Find the k nearest stations to each query point
+
+        Returns:
+            Distances in km and station codes, each of shape (points, k)
+        """
+        k = min(k, len(self.stations))
+        chord, codes = self._tree.query(_to_unit_vectors(lat, lon), k=np.arange(1, k + 1))
+        return _chord_to_km(chord), codes
+
+    def within_radius(self, lat, lon, radius_km: float) -> List[np.ndarray]:
+        """Station codes within radius_km of each query point"""
+        hits = self._tree.query_ball_point(_to_unit_vectors(lat, lon), _km_to_chord(radius_km))
+        return [np.sort(np.asarray(codes, dtype=int)) for codes in hits]
+
+    def interpolate(self, values: pd.DataFrame, lat, lon,
+                    k: int = 4, power: float = 2.0) -> pd.DataFrame:
+        """
+        Inverse-distance weighted interpolation of station values to points
+
+        Args:
+            values: One column per station id, e.g. daily yhat indexed by ds
+            lat: Latitudes of the query points
+            lon: Longitudes of the query points
+            k: Number of nearest stations with a value contributing to each point
+            power: Distance weighting exponent
+
+        Returns:
+            Interpolated values with one column per query point
+        """
+        # Align value columns to station codes; stations without values are NaN
+        grid = np.full((len(values), len(self.stations)), np.nan)
+        grid[:, self.codes(values.columns)] = values.to_numpy(dtype=float)
+        points = _to_unit_vectors(lat, lon)
+        result = np.full((len(values), len(points)), np.nan)
+
+        # Neighbours are chosen among the stations reporting at each time step,
+        # so time steps sharing a set of reporting stations share one query
+        available = ~np.isnan(grid)
+        patterns, group = np.unique(available, axis=0, return_inverse=True)
+        group = group.ravel()
+        for pattern_code, pattern in enumerate(patterns):
+            rows = np.flatnonzero(group == pattern_code)
+            reporting = np.flatnonzero(pattern)
+            if len(reporting) == 0:
+                continue
+
+            tree = self._tree if pattern.all() else cKDTree(self._tree.data[reporting])
+            n = min(k, len(reporting))
+            chord, nearest = tree.query(points, k=np.arange(1, n + 1))
+            distances = _chord_to_km(chord)
+            neighbours = grid[rows][:, reporting[nearest]]       # (rows, points, k)
+
+            # A point sitting on a station takes that station's value
+            with np.errstate(divide='ignore'):
+                weights = 1.0 / distances ** power
+            exact = distances <= 1e-9
+            weights = np.where(exact.any(axis=1, keepdims=True), exact.astype(float), weights)
+            result[rows] = (neighbours * weights).sum(axis=2) / weights.sum(axis=1)
+
+        return pd.DataFrame(result, index=values.index)
+
+    def assign_regions(self, polygons: Dict[str, np.ndarray]) -> pd.Series:
+        """
+        Assign each station to the first polygon containing it
+
+        Args:
+            polygons: Region name to a (vertices, 2) array of lon/lat vertices
+
+        Returns:
+            Region name per station code, NaN for stations outside all polygons
+        """
+        lon = self.stations['lon'].to_numpy(dtype=float)[:, None]
+        lat = self.stations['lat'].to_numpy(dtype=float)[:, None]
+        regions = pd.Series(np.nan, index=self.stations.index, dtype=object, name='region')
+
+        for name, vertices in polygons.items():
+            vertices = np.asarray(vertices, dtype=float)
+            x1, y1 = vertices[:, 0], vertices[:, 1]
+            x2, y2 = np.roll(x1, -1), np.roll(y1, -1)
+
+            # Ray casting: count polygon edges crossed by a ray heading east
+            spans = (y1 > lat) != (y2 > lat)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                crossing_x = x1 + (lat - y1) * (x2 - x1) / (y2 - y1)
+            inside = (spans & (lon < crossing_x)).sum(axis=1) % 2 == 1
+
+            regions[inside & regions.isna().to_numpy()] = name
+
+        return regions
@@ -0,0 +1,18 @@
+import importlib.util
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+# The data collection package lives in a directory with a space in its name,
+# so register it under the importable name the code base uses
+if 'data_collection' not in sys.modules:
+    package_dir = os.path.join(ROOT, 'data collection')
+    spec = importlib.util.spec_from_file_location(
+        'data_collection', os.path.join(package_dir, '__init__.py'),
+        submodule_search_locations=[package_dir]
+    )
+    module = importlib.util.module_from_spec(spec)
+    sys.modules['data_collection'] = module
+    spec.loader.exec_module(module)
\ No newline at end of file
@@ -0,0 +1,89 @@
+import numpy as np
+import pandas as pd
+import pytest
+from data_collection import WeatherDataCollector, ChunkedDataCleaner, TDigest
+
+VALUE_COLUMNS = ['temperature', 'rainfall', 'humidity', 'wind_speed']
+
+
+@pytest.fixture(scope='module')
+def raw_data():
+    """Synthetic history with duplicated dates and gaps to fill"""
+    collector = WeatherDataCollector()
+    df = collector.generate_historical_data(years=20)
+    df = pd.concat([df, df.iloc[100:110], df.iloc[5000:5003]])
+    df = df.sort_values('date', kind='mergesort').reset_index(drop=True)
+
+    rng = np.random.default_rng(0)
+    for col in ['temperature', 'humidity', 'rainfall']:
+        df.loc[rng.choice(len(df), 300, replace=False), col] = np.nan
+    return df
+
+
+def exact_bounds(df):
+    """Outlier bounds computed the way clean_data does, in memory"""
+    df = df.drop_duplicates(subset=['date'])
+    df = df.assign(**{
+        col: df[col].fillna(df[col].rolling(7, min_periods=1).mean())
+        for col in VALUE_COLUMNS
+    })
+
+    bounds = {}
+    for col in ['temperature', 'humidity']:
+        bounds[col] = (df[col].quantile(0.01), df[col].quantile(0.99))
+        df = df[(df[col] >= bounds[col][0]) & (df[col] <= bounds[col][1])]
+    return bounds
+
+
+@pytest.mark.parametrize('chunk_size', [3, 50, 333, 1000])
+def test_chunked_cleaning_matches_in_memory(raw_data, chunk_size):
+    expected = WeatherDataCollector().clean_data(raw_data)
+
+    def chunk_source():
+        return (raw_data.iloc[i:i + chunk_size] for i in range(0, len(raw_data), chunk_size))
+
+    cleaner = ChunkedDataCleaner()
+    cleaned = pd.concat(list(cleaner.clean(chunk_source)))
+
+    # Sketched bounds stay close to the exact quantiles, so only rows sitting
+    # right at the 1%/99% cut-offs may be kept or dropped differently
+    for col, (lower, upper) in exact_bounds(raw_data).items():
+        assert cleaner.bounds[col][0] == pytest.approx(lower, abs=0.25)
+        assert cleaner.bounds[col][1] == pytest.approx(upper, abs=0.25)
+
+    assert not cleaned['date'].duplicated().any()
+    differing = set(expected['date']) ^ set(cleaned['date'])
+    assert len(differing) <= 0.005 * len(expected)
+
+    merged = expected.merge(cleaned, on='date', suffixes=('_expected', '_chunked'))
+    for col in VALUE_COLUMNS:
+        np.testing.assert_allclose(merged[f'{col}_chunked'], merged[f'{col}_expected'],
+                                   rtol=0, atol=1e-9)
+
+
+def test_unsorted_chunks_are_rejected(raw_data):
+    shuffled = raw_data.sample(frac=1, random_state=0)
+    chunks = lambda: (shuffled.iloc[i:i + 100] for i in range(0, len(shuffled), 100))
+    with pytest.raises(ValueError, match='sorted by date'):
+        ChunkedDataCleaner().fit(chunks)
+
+    # Each chunk sorted on its own, but chunks out of order
+    reversed_chunks = lambda: (raw_data.iloc[i:i + 100] for i in range(len(raw_data) - 100, -1, -100))
+    with pytest.raises(ValueError, match='sorted by date'):
+        ChunkedDataCleaner().fit(reversed_chunks)
+
+
+def test_tdigest_quantiles_and_extremes():
+    values = np.random.default_rng(1).normal(size=500_000)
+
+    digest = TDigest(200)
+    for part in np.array_split(values, 7):
+        partial = TDigest(200)
+        partial.update(part)
+        digest.merge(partial)
+
+    assert digest.count == len(values)
+    assert digest.quantile(0) == values.min()
+    assert digest.quantile(1) == values.max()
+    for q in [0.01, 0.25, 0.5, 0.75, 0.99]:
+        assert digest.quantile(q) == pytest.approx(np.quantile(values, q), abs=0.01)
\ No newline at end of file
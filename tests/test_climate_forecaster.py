@@ -0,0 +1,37 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip('prophet')
+
+from forecasting.climate_forecaster import ClimateForecaster
+
+
+@pytest.fixture
+def observed():
+    dates = pd.date_range('2025-01-01', periods=10)
+    return pd.DataFrame({
+        'date': dates,
+        'temperature': np.arange(20.0, 30.0),
+        'rainfall': [0.0, 0.0, 4.0, 2.0, 0.0, 5.0, 0.0, 0.0, 1.0, 0.0]
+    })
+
+
+def test_accuracy_metric_is_fixed_per_target(observed):
+    forecaster = ClimateForecaster()
+    temp = forecaster.evaluate_model(
+        observed, pd.DataFrame({'ds': observed['date'], 'yhat': observed['temperature'] + 1}))
+    assert temp['accuracy'] == pytest.approx(100 - temp['mape'])
+
+    # Rainfall keeps sMAPE even when no actual in the window is zero
+    for rainfall in (observed, observed.iloc[[2, 3, 5, 8]]):
+        forecast = pd.DataFrame({'ds': rainfall['date'], 'yhat': rainfall['rainfall'] + 0.5})
+        rain = forecaster.evaluate_model(rainfall, forecast, metric='rainfall')
+        assert rain['accuracy'] == pytest.approx(100 - rain['smape'])
+        assert 0 <= rain['smape'] <= 200
+
+
+def test_no_overlap_raises(observed):
+    forecast = pd.DataFrame({'ds': observed['date'] + pd.Timedelta(days=100), 'yhat': 20.0})
+    with pytest.raises(ValueError, match='overlap'):
+        ClimateForecaster().evaluate_model(observed, forecast)
\ No newline at end of file
@@ -0,0 +1,120 @@
+import threading
+import time
+import pytest
+
+pytest.importorskip('prophet')
+from scheduler.forecast_scheduler import ForecastScheduler
+
+HOUR = 3600.0
+
+
+class FakeClock:
+    """Manually advanced time source"""
+
+    def __init__(self, now: float = 1_000_000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def wait_idle(scheduler, timeout: float = 5.0):
+    """Wait until no forecast runs are in flight"""
+    deadline = time.time() + timeout
+    while scheduler.metrics()['in_flight'] and time.time() < deadline:
+        time.sleep(0.01)
+    assert scheduler.metrics()['in_flight'] == 0
+
+
+def test_dispatch_respects_worker_limit():
+    release = threading.Event()
+    clock = FakeClock()
+    scheduler = ForecastScheduler(lambda sid: release.wait(5), {'max_workers': 2}, clock=clock)
+    for station_id in ['a', 'b', 'c']:
+        scheduler.add_station(station_id)
+
+    assert scheduler.run_pending() == 2
+    metrics = scheduler.metrics()
+    assert metrics['in_flight'] == 2
+    assert metrics['queue_depth'] == 1
+
+    release.set()
+    wait_idle(scheduler)
+    assert scheduler.run_pending() == 1
+    wait_idle(scheduler)
+    assert scheduler.metrics()['completed'] == 3
+    scheduler.shutdown()
+
+
+def test_failed_runs_back_off_exponentially():
+    def fail(station_id):
+        raise RuntimeError('model failed')
+
+    clock = FakeClock()
+    scheduler = ForecastScheduler(fail, {'retry_delay_minutes': 5}, clock=clock)
+    scheduler.add_station('a')
+
+    for expected_delay in [5 * 60, 10 * 60, 20 * 60]:
+        started = clock.now
+        assert scheduler.run_pending() == 1
+        wait_idle(scheduler)
+        assert scheduler._stations['a']['due'] == started + expected_delay
+
+        clock.now += expected_delay - 1
+        assert scheduler.run_pending() == 0
+        clock.now += 1
+
+    assert scheduler.metrics()['failed'] == 3
+    scheduler.shutdown()
+
+
+def test_failing_result_sink_counts_as_failed_run():
+    def sink(station_id, result):
+        raise IOError('disk full')
+
+    scheduler = ForecastScheduler(lambda sid: {}, {}, on_result=sink, clock=FakeClock())
+    scheduler.add_station('a')
+    scheduler.run_pending()
+    wait_idle(scheduler)
+
+    metrics = scheduler.metrics()
+    assert (metrics['completed'], metrics['failed']) == (0, 1)
+    scheduler.shutdown()
+
+
+def test_new_data_pulls_refresh_forward():
+    clock = FakeClock()
+    config = {'max_model_age_hours': 24, 'arrival_delay_minutes': 15}
+    scheduler = ForecastScheduler(lambda sid: {}, config, clock=clock)
+    scheduler.add_station('a')
+    started = clock.now
+    scheduler.run_pending()
+    wait_idle(scheduler)
+    assert scheduler._stations['a']['due'] == started + 24 * HOUR
+
+    clock.now += HOUR
+    scheduler.notify_data('a')
+    assert scheduler._stations['a']['due'] == clock.now + 15 * 60
+    scheduler.shutdown()
+
+
+def test_queue_resumes_from_state_file(tmp_path):
+    state_file = str(tmp_path / 'scheduler_state.json')
+    config = {'state_file': state_file, 'max_model_age_hours': 24}
+    clock = FakeClock()
+
+    scheduler = ForecastScheduler(lambda sid: {}, config, clock=clock)
+    scheduler.add_station('done')
+    started = clock.now
+    scheduler.run_pending()
+    wait_idle(scheduler)
+    scheduler.add_station('never_run')
+    scheduler.shutdown()
+
+    clock.now += HOUR
+    restarted = ForecastScheduler(lambda sid: {}, config, clock=clock)
+    assert restarted._stations['done']['due'] == started + 24 * HOUR
+    assert restarted._stations['never_run']['due'] <= clock.now
+    assert restarted.run_pending() == 1
+    wait_idle(restarted)
+    restarted.shutdown()
\ No newline at end of file
@@ -0,0 +1,109 @@
+import numpy as np
+import pandas as pd
+import pytest
+from forecasting.monitoring import ForecastMonitor, MetricAccumulator
+
+SETTINGS = {'ewm_alpha': 0.1, 'drift_ratio': 1.5, 'min_observations': 30, 'max_horizon_days': 30}
+
+
+def forecast(start, level, days=30):
+    return pd.DataFrame({'ds': pd.date_range(start, periods=days), 'yhat': level})
+
+
+@pytest.mark.parametrize('splits', [[500], [1, 499], [137, 200, 163], list(range(1, 32))])
+def test_merge_matches_single_pass(splits):
+    rng = np.random.default_rng(0)
+    actual = np.clip(rng.normal(2, 3, sum(splits)), 0, None)
+    predicted = actual + rng.normal(0, 1, len(actual))
+    actual[::7] = np.nan
+
+    single = MetricAccumulator()
+    single.update(actual, predicted)
+
+    merged = MetricAccumulator()
+    for part_actual, part_predicted in zip(np.split(actual, np.cumsum(splits)[:-1]),
+                                           np.split(predicted, np.cumsum(splits)[:-1])):
+        part = MetricAccumulator()
+        part.update(part_actual, part_predicted)
+        merged.merge(part)
+
+    expected = single.metrics()
+    result = merged.metrics()
+    # The EWM is a recency measure and only approximated by a merge
+    expected.pop('recent_mae')
+    result.pop('recent_mae')
+    assert result.keys() == expected.keys()
+    for name, value in expected.items():
+        assert result[name] == pytest.approx(value, rel=1e-9), name
+
+
+def test_batched_updates_match_one_at_a_time():
+    rng = np.random.default_rng(1)
+    actual, predicted = rng.normal(20, 3, 100), rng.normal(20, 3, 100)
+
+    batched, stepwise = MetricAccumulator(), MetricAccumulator()
+    batched.update(actual, predicted)
+    for a, p in zip(actual, predicted):
+        stepwise.update(a, p)
+
+    for name, value in stepwise.metrics().items():
+        assert batched.metrics()[name] == pytest.approx(value, rel=1e-9), name
+
+
+def test_zero_actuals():
+    acc = MetricAccumulator()
+    acc.update([0.0, 0.0, 2.0], [0.0, 1.0, 1.0])
+    scores = acc.metrics()
+
+    # MAPE covers the non-zero actual only; sMAPE is 0 when both values are 0
+    assert scores['mape'] == pytest.approx(50.0)
+    assert scores['smape'] == pytest.approx((0 + 200 + 200 / 3) / 3)
+    assert MetricAccumulator().metrics() == {'count': 0}
+
+
+def test_unobserved_forecasts_expire():
+    monitor = ForecastMonitor(SETTINGS)
+    monitor.record_forecast('a', 'temperature', forecast('2025-01-02', 20.0), '2025-01-01 06:00')
+    monitor.record_forecast('a', 'temperature', forecast('2025-04-02', 20.0), '2025-04-01 06:00')
+
+    assert len(monitor._pending) == 30
+    assert all(date >= pd.Timestamp('2025-04-02') for _, _, date in monitor._pending)
+
+
+def test_new_run_supersedes_pending_forecasts():
+    monitor = ForecastMonitor(SETTINGS)
+    monitor.record_forecast('a', 'temperature', forecast('2025-01-02', 10.0), '2025-01-01 06:00')
+    monitor.record_forecast('a', 'temperature', forecast('2025-01-03', 20.0), '2025-01-02 06:00')
+
+    # Only the second run's forecast is scored; the first run's never will be
+    monitor.observe('a', 'temperature', '2025-01-02', 20.0)
+    monitor.observe('a', 'temperature', '2025-01-03', 20.0)
+    assert list(monitor.accumulators) == [('a', 'temperature', 1)]
+    assert monitor.accumulators[('a', 'temperature', 1)].sum_abs_error == 0
+
+    # A run older than the current one is ignored
+    monitor.record_forecast('a', 'temperature', forecast('2025-01-05', 0.0), '2025-01-01 07:00')
+    assert monitor._pending[('a', 'temperature', pd.Timestamp('2025-01-05'))][2] == 20.0
+
+
+def test_drift_stops_once_the_model_is_retrained():
+    rng = np.random.default_rng(0)
+    monitor = ForecastMonitor(SETTINGS)
+    days = pd.date_range('2024-01-01', periods=200)
+    actual = 20 + rng.normal(0, 1, len(days))
+    actual[120:] += 6
+
+    retrains = []
+    level = 20.0
+    for i, day in enumerate(days[:-1]):
+        # Daily runs forecast the recent level; a drifted run is replaced at once
+        monitor.record_forecast('a', 'temperature', forecast(day, level), day + pd.Timedelta(hours=1))
+        if monitor.observe('a', 'temperature', day, actual[i]):
+            retrains.append(i)
+            level = actual[i]
+            monitor.record_forecast('a', 'temperature', forecast(day, level), day + pd.Timedelta(hours=2))
+        level = actual[max(i - 2, 0):i + 1].mean()
+
+    assert retrains[0] == 120
+    assert len(retrains) <= 3
+    assert monitor.drifted() == []
\ No newline at end of file
@@ -0,0 +1,103 @@
+import numpy as np
+import pandas as pd
+import pytest
+from alert.alert_system import AlertSystem
+from risk_assessment.risk_assessor import RiskAssessor
+from utils.records import Alerts, RiskEpisodes, _HEADER, _MAGIC
+
+IMPACT = {'High': 50000, 'Medium': 15000, 'Low': 1000}
+
+
+@pytest.fixture
+def assessor():
+    return RiskAssessor({'financial_impact': IMPACT})
+
+
+@pytest.fixture
+def rain_forecast():
+    rng = np.random.default_rng(0)
+    return pd.DataFrame({
+        'ds': pd.date_range('2025-01-01', periods=365),
+        'yhat': rng.exponential(5, 365)
+    })
+
+
+@pytest.fixture
+def temp_forecast():
+    rng = np.random.default_rng(1)
+    return pd.DataFrame({
+        'ds': pd.date_range('2025-01-01', periods=365),
+        'yhat': rng.normal(31, 4, 365)
+    })
+
+
+@pytest.mark.parametrize('risk_type, assess', [
+    ('drought', 'assess_drought_risk'),
+    ('flood', 'assess_flood_risk'),
+    ('extreme_heat', 'assess_extreme_heat')
+])
+def test_episode_and_frame_impact_agree(assessor, rain_forecast, temp_forecast, risk_type, assess):
+    forecast = temp_forecast if risk_type == 'extreme_heat' else rain_forecast
+    risk_df = getattr(assessor, assess)(forecast)
+    episodes = assessor.extract_risk_episodes(risk_df, risk_type, station_id=3)
+
+    from_frame = assessor.calculate_financial_impact(risk_df, risk_type)
+    from_episodes = assessor.calculate_financial_impact(episodes, risk_type)
+
+    assert from_frame == from_episodes
+    assert from_episodes['total_impact'] == pytest.approx(episodes.records['impact'].sum())
+    assert (episodes.records['station_id'] == 3).all()
+
+
+def test_risk_episodes_are_runs_of_equal_level(assessor, rain_forecast):
+    risk_df = assessor.assess_drought_risk(rain_forecast)
+    episodes = assessor.extract_risk_episodes(risk_df, 'drought').to_frame()
+
+    # Episodes tile the assessed days without gaps and alternate in level
+    assessed = risk_df.dropna(subset=['drought_risk'])
+    assert episodes['days'].sum() == len(assessed)
+    assert (episodes['level'].astype(str).shift() != episodes['level'].astype(str)).all()
+    assert episodes['start'].iloc[0] == assessed['ds'].iloc[0]
+    assert episodes['end'].iloc[-1] == assessed['ds'].iloc[-1]
+
+
+def test_binary_round_trip(assessor, rain_forecast):
+    episodes = assessor.extract_risk_episodes(assessor.assess_drought_risk(rain_forecast))
+    payload = episodes.to_bytes()
+
+    assert len(payload) == _HEADER.size + episodes.nbytes
+    restored = RiskEpisodes.from_bytes(payload)
+    np.testing.assert_array_equal(restored.records, episodes.records)
+
+    empty = Alerts.from_bytes(Alerts().to_bytes())
+    assert len(empty) == 0
+
+
+def test_from_bytes_rejects_wrong_kind_and_version(assessor, rain_forecast):
+    payload = assessor.extract_risk_episodes(assessor.assess_drought_risk(rain_forecast)).to_bytes()
+
+    with pytest.raises(ValueError, match='Alerts'):
+        Alerts.from_bytes(payload)
+
+    _, kind, _, count = _HEADER.unpack_from(payload)
+    future = _HEADER.pack(_MAGIC, kind, 99, count) + payload[_HEADER.size:]
+    with pytest.raises(ValueError, match='version'):
+        RiskEpisodes.from_bytes(future)
+
+
+def test_alert_records_match_thresholds(assessor, rain_forecast, temp_forecast):
+    alert_system = AlertSystem({'alert_thresholds': {'extreme_heat': 35, 'heavy_rainfall': 20}})
+    merged = temp_forecast.merge(rain_forecast, on='ds', suffixes=('_temp', '_rain'))
+    drought_risk = assessor.assess_drought_risk(rain_forecast)
+
+    alerts = alert_system.check_thresholds(merged, drought_risk)
+    counts = pd.Series([alert['alert_type'] for alert in alerts]).value_counts()
+
+    assert counts.get('extreme_heat', 0) == (merged['yhat_temp'] > 35).sum()
+    assert counts.get('heavy_rainfall', 0) == (merged['yhat_rain'] > 20).sum()
+    assert counts.get('drought', 0) == (drought_risk['drought_risk'] == 'High').sum()
+
+    # Records from another station are merged into the report
+    alert_system.load_alerts(Alerts.from_bytes(alert_system.alerts.to_bytes()))
+    assert len(alert_system.alerts) == 2 * len(alerts)
+    assert 'Extreme Heat' in alert_system.generate_alert_report()
\ No newline at end of file
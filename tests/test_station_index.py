@@ -0,0 +1,88 @@
+import numpy as np
+import pandas as pd
+import pytest
+import config
+from spatial.station_index import StationIndex, EARTH_RADIUS_KM
+
+
+def haversine_km(lat1, lon1, lat2, lon2):
+    lat1, lon1, lat2, lon2 = map(np.radians, (lat1, lon1, lat2, lon2))
+    a = (np.sin((lat2 - lat1) / 2) ** 2
+         + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2)
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(a))
+
+
+def idw(index, values, lat, lon, power=2.0):
+    """Brute-force IDW over the given {station_id: value} mapping"""
+    stations = index.stations.set_index('station_id').loc[list(values)]
+    weights = 1.0 / haversine_km(lat, lon, stations['lat'], stations['lon']) ** power
+    return float((weights * pd.Series(values)).sum() / weights.sum())
+
+
+@pytest.fixture
+def index():
+    return StationIndex(config.STATIONS)
+
+
+def test_nearest_matches_brute_force(index):
+    lat, lon = [-2.0, 0.5], [37.5, 35.0]
+    distances, codes = index.nearest(lat, lon, k=3)
+
+    assert distances.shape == codes.shape == (2, 3)
+    for row, (plat, plon) in enumerate(zip(lat, lon)):
+        expected = haversine_km(plat, plon, index.stations['lat'], index.stations['lon'])
+        np.testing.assert_array_equal(codes[row], np.argsort(expected.to_numpy())[:3])
+        np.testing.assert_allclose(distances[row], np.sort(expected)[:3], rtol=1e-9)
+
+    # Asking for more neighbours than stations returns every station
+    assert index.nearest(lat, lon, k=10)[1].shape == (2, len(index))
+
+
+def test_within_radius(index):
+    nairobi = index.stations.iloc[0]
+    to_nakuru = haversine_km(nairobi['lat'], nairobi['lon'], -0.3031, 36.0800)
+
+    inside, = index.within_radius(nairobi['lat'], nairobi['lon'], to_nakuru + 1)
+    outside, = index.within_radius(nairobi['lat'], nairobi['lon'], to_nakuru - 1)
+    assert list(inside) == list(index.codes(['nairobi', 'nakuru']))
+    assert list(outside) == list(index.codes(['nairobi']))
+
+
+def test_interpolate_uses_only_stations_with_values(index):
+    values = pd.DataFrame({
+        'nairobi': [20.0, np.nan, 24.0],
+        'mombasa': [28.0, 29.0, 30.0],
+        'kisumu': [22.0, 23.0, np.nan]
+    }, index=pd.date_range('2025-01-01', periods=3, name='ds'))
+
+    result = index.interpolate(values, [-2.0], [37.5], k=3)
+
+    # Nakuru and Garissa are closer than Kisumu but have no values
+    for day, row in values.iterrows():
+        expected = idw(index, row.dropna().to_dict(), -2.0, 37.5)
+        assert result.loc[day, 0] == pytest.approx(expected)
+
+
+def test_interpolate_on_a_station(index):
+    values = pd.DataFrame({'nairobi': [20.0, np.nan], 'mombasa': [28.0, 29.0]})
+    nairobi = index.stations.iloc[0]
+
+    result = index.interpolate(values, [nairobi['lat']], [nairobi['lon']], k=2)
+
+    # The station's own value wins; without one the neighbours are weighted
+    assert result.loc[0, 0] == 20.0
+    assert result.loc[1, 0] == pytest.approx(29.0)
+    assert np.isnan(index.interpolate(values.iloc[:, :1], [0.0], [37.0]).loc[1, 0])
+
+
+def test_assign_regions(index):
+    polygons = {
+        'west': np.array([[33.0, -2.0], [36.5, -2.0], [36.5, 1.0], [33.0, 1.0]]),
+        'everything': np.array([[30.0, -6.0], [42.0, -6.0], [42.0, 3.0], [30.0, 3.0]])
+    }
+    regions = index.assign_regions(polygons)
+
+    expected = {'kisumu': 'west', 'nakuru': 'west', 'nairobi': 'everything',
+                'mombasa': 'everything', 'garissa': 'everything'}
+    assert regions[index.codes(expected)].tolist() == list(expected.values())
+    assert index.assign_regions({'west': polygons['west']}).isna().sum() == 3
\ No newline at end of file
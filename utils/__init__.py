@@ -1,10 +1,12 @@
 """
 Utility module for the Climate Forecasting System.
 
-This module contains utility functions and helpers.
+This module contains utility functions and helpers, and the compact
+record types used to exchange risk episodes and alerts.
 """
 
 from .logger import setup_logger
+from .records import RecordBatch, RiskEpisodes, Alerts
 
-__all__ = ['setup_logger']
+__all__ = ['setup_logger', 'RecordBatch', 'RiskEpisodes', 'Alerts']
 __version__ = '1.0.0'
\ No newline at end of file
@@ -0,0 +1,131 @@
+import struct
+import pandas as pd
+import numpy as np
+from typing import Any, Dict, Iterable, List
+
+# Category codes stored as uint8 in the record arrays
+RISK_LEVELS = ('Low', 'Medium', 'High')
+RISK_TYPES = ('drought', 'flood', 'extreme_heat')
+ALERT_TYPES = ('extreme_heat', 'heavy_rainfall', 'drought')
+
+RISK_EPISODE_DTYPE = np.dtype([
+    ('station_id', '<u4'),
+    ('risk_type', 'u1'),
+    ('level', 'u1'),
+    ('days', '<u2'),
+    ('start', '<M8[D]'),
+    ('end', '<M8[D]'),
+    ('peak_score', '<f4'),
+    ('impact', '<f8')
+])
+
+ALERT_DTYPE = np.dtype([
+    ('station_id', '<u4'),
+    ('alert_type', 'u1'),
+    ('severity', 'u1'),
+    ('date', '<M8[D]'),
+    ('value', '<f4'),
+    ('threshold', '<f4')
+])
+
+# Binary layout: magic, record kind, format version, record count, packed records
+_HEADER = struct.Struct('<4sBBxxQ')
+_MAGIC = b'CFSR'
+_VERSION = 1
+
+
+class RecordBatch:
+    """Structured NumPy array of fixed-width records with binary serialization"""
+
+    __slots__ = ('records',)
+
+    dtype: np.dtype = None
+    kind: int = 0
+    categories: Dict[str, tuple] = {}
+
+    def __init__(self, records: np.ndarray = None):
+        """Wrap an existing record array or create an empty batch"""
+        if records is None:
+            records = np.empty(0, dtype=self.dtype)
+        self.records = np.asarray(records, dtype=self.dtype)
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def __getitem__(self, key):
+        selected = self.records[key]
+        return type(self)(selected) if isinstance(selected, np.ndarray) else selected
+
+    @property
+    def nbytes(self) -> int:
+        """Size of the packed records in bytes"""
+        return self.records.nbytes
+
+    @classmethod
+    def concat(cls, batches: Iterable['RecordBatch']) -> 'RecordBatch':
+        """Concatenate several batches of the same record type"""
+        arrays = [batch.records for batch in batches]
+        return cls(np.concatenate(arrays) if arrays else None)
+
+    def to_bytes(self) -> bytes:
+        """Serialize to a compact little-endian binary payload"""
+        header = _HEADER.pack(_MAGIC, self.kind, _VERSION, len(self.records))
+        return header + self.records.tobytes()
+
+    @classmethod
+    def from_bytes(cls, payload: bytes) -> 'RecordBatch':
+        """Deserialize a payload without copying the record data"""
+        magic, kind, version, count = _HEADER.unpack_from(payload)
+        if magic != _MAGIC or kind != cls.kind:
+            raise ValueError(f"Payload does not contain {cls.__name__} records")
+        if version != _VERSION:
+            raise ValueError(f"Unsupported record format version: {version}")
+
+        records = np.frombuffer(payload, dtype=cls.dtype, count=count, offset=_HEADER.size)
+        return cls(records)
+
+    def to_frame(self) -> pd.DataFrame:
+        """Expand the records into a DataFrame with readable category labels"""
+        df = pd.DataFrame(self.records)
+        for col, labels in self.categories.items():
+            df[col] = pd.Categorical.from_codes(df[col], categories=list(labels))
+        return df
+
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        """Expand the records into plain dictionaries"""
+        return self.to_frame().to_dict('records')
+
+
+class RiskEpisodes(RecordBatch):
+    """Consecutive days at the same risk level, one record per episode"""
+
+    __slots__ = ()
+
+    dtype = RISK_EPISODE_DTYPE
+    kind = 1
+    categories = {'risk_type': RISK_TYPES, 'level': RISK_LEVELS}
+
+    def select(self, risk_type: str = None, level: str = None) -> 'RiskEpisodes':
+        """Filter episodes by risk type and/or level"""
+        mask = np.ones(len(self.records), dtype=bool)
+        if risk_type is not None:
+            mask &= self.records['risk_type'] == RISK_TYPES.index(risk_type)
+        if level is not None:
+            mask &= self.records['level'] == RISK_LEVELS.index(level)
+        return RiskEpisodes(self.records[mask])
+
+    def days_by_level(self) -> Dict[str, int]:
+        """Total number of days spent at each risk level"""
+        days = np.bincount(self.records['level'], weights=self.records['days'],
+                           minlength=len(RISK_LEVELS))
+        return {level: int(days[code]) for code, level in enumerate(RISK_LEVELS)}
+
+
+class Alerts(RecordBatch):
+    """Early warning alerts, one record per station, type and day"""
+
+    __slots__ = ()
+
+    dtype = ALERT_DTYPE
+    kind = 2
+    categories = {'alert_type': ALERT_TYPES, 'severity': RISK_LEVELS}